@@ -1,12 +1,29 @@
 """Generate memes via imgflip API and download as PNGs."""
 
-import requests
+import asyncio
+import hashlib
 import os
+from functools import cache
+from pathlib import Path
+
+import httpx
+import orjson
+from dotenv import load_dotenv
 
-USERNAME = "SeanReed3"
-PASSWORD = "alphaBeta1"
 API_URL = "https://api.imgflip.com/caption_image"
-OUT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = Path(__file__).resolve().parent
+
+# Connection pool shared by every request in the run. With HTTP/2, requests
+# to the same origin are multiplexed over a single keep-alive connection.
+POOL_LIMIT = 10
+KEEPALIVE_TIMEOUT = 30
+
+# Cap concurrent memes to stay under imgflip's rate limit; retry 429s
+MAX_IN_FLIGHT = 4
+MAX_RETRIES = 3
+
+# Read size when streaming downloaded images to disk
+CHUNK_SIZE = 1 << 16
 
 MEMES = [
     {
@@ -77,31 +94,122 @@ MEMES = [
 ]
 
 
-def generate_meme(meme: dict) -> str:
+@cache
+def _credentials() -> tuple[str, str]:
+    """Load Imgflip credentials from the environment / .env (once)."""
+    load_dotenv()
+    try:
+        return os.environ["IMAGEFLIP_USERNAME"], os.environ["IMAGEFLIP_PASSWORD"]
+    except KeyError as e:
+        raise RuntimeError(f"{e.args[0]} is not set (add it to .env)") from e
+
+
+async def _post_caption(client: httpx.AsyncClient, data: dict) -> dict:
+    """POST a caption request, retrying on HTTP 429.
+
+    Waits for the Retry-After header when present, otherwise backs off
+    exponentially. Raises httpx.HTTPStatusError once retries run out or on
+    any other non-2xx response.
+    """
+    resp = await client.post(API_URL, data=data)
+    for attempt in range(MAX_RETRIES):
+        if resp.status_code != 429:
+            break
+        try:
+            delay = float(resp.headers.get("Retry-After", ""))
+        except ValueError:
+            delay = 2**attempt
+        await asyncio.sleep(delay)
+        resp = await client.post(API_URL, data=data)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+def _digest(meme: dict) -> str:
+    """Hash the inputs that determine a meme's image."""
+    key = orjson.dumps(
+        {"template_id": meme["template_id"], "boxes": meme["boxes"]},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(key).hexdigest()
+
+
+def _is_up_to_date(meme: dict) -> bool:
+    """True if the meme's PNG was generated from its current template/captions."""
+    out_path = OUT_DIR / meme["filename"]
+    sha_path = out_path.with_name(f"{out_path.name}.sha")
+    return (
+        out_path.exists()
+        and sha_path.exists()
+        and sha_path.read_text() == _digest(meme)
+    )
+
+
+async def generate_meme(client: httpx.AsyncClient, meme: dict) -> str:
+    out_path = OUT_DIR / meme["filename"]
+    sha_path = out_path.with_name(f"{out_path.name}.sha")
+    # Skip memes whose template and captions haven't changed since last run
+    if _is_up_to_date(meme):
+        print(f"SKIP {meme['filename']} (up to date)")
+        return str(out_path)
+    digest = _digest(meme)
+
+    username, password = _credentials()
     data = {
         "template_id": meme["template_id"],
-        "username": USERNAME,
-        "password": PASSWORD,
+        "username": username,
+        "password": password,
     }
     for i, box in enumerate(meme["boxes"]):
         data[f"boxes[{i}][text]"] = box["text"]
 
-    resp = requests.post(API_URL, data=data)
-    result = resp.json()
+    result = await _post_caption(client, data)
     if not result["success"]:
         print(f"FAILED {meme['filename']}: {result.get('error_message', result)}")
         return ""
 
     img_url = result["data"]["url"]
-    img_resp = requests.get(img_url)
-    out_path = os.path.join(OUT_DIR, meme["filename"])
-    with open(out_path, "wb") as f:
-        f.write(img_resp.content)
+    # Stream the PNG to disk instead of buffering the whole image
+    async with client.stream("GET", img_url) as img_resp:
+        img_resp.raise_for_status()
+        with open(out_path, "wb") as f:
+            async for chunk in img_resp.aiter_bytes(CHUNK_SIZE):
+                f.write(chunk)
+    sha_path.write_text(digest)
     print(f"OK {meme['filename']} -> {out_path}")
-    return out_path
+    return str(out_path)
+
+
+async def main() -> None:
+    # Fail fast before any requests are made, but only when at least one meme
+    # needs regenerating; fully up-to-date runs don't need credentials
+    if not all(_is_up_to_date(m) for m in MEMES):
+        _credentials()
+
+    # All memes are independent HTTP round-trips, so run them concurrently
+    # (bounded by MAX_IN_FLIGHT)
+    sem = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    async def bounded(meme: dict) -> str:
+        # Report a failed meme without cancelling the rest of the TaskGroup
+        try:
+            async with sem:
+                return await generate_meme(client, meme)
+        except Exception as e:
+            print(f"FAILED {meme['filename']}: {e!r}")
+            return ""
+
+    limits = httpx.Limits(
+        max_connections=POOL_LIMIT,
+        max_keepalive_connections=POOL_LIMIT,
+        keepalive_expiry=KEEPALIVE_TIMEOUT,
+    )
+    async with httpx.AsyncClient(http2=True, limits=limits) as client:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(bounded(m)) for m in MEMES]
+    failed = sum(1 for t in tasks if not t.result())
+    print(f"\nDone! ({failed} failed)" if failed else "\nDone!")
 
 
 if __name__ == "__main__":
-    for m in MEMES:
-        generate_meme(m)
-    print("\nDone!")
+    asyncio.run(main())
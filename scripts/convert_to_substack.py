@@ -11,17 +11,16 @@ from __future__ import annotations
 
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-import matplotlib
-import matplotlib.pyplot as plt
-from PIL import ImageFont
+from PIL import Image, ImageDraw, ImageFont
 from pygments import highlight
 from pygments.formatters import ImageFormatter
+from pygments.lexer import Lexer
 from pygments.lexers import get_lexer_by_name, guess_lexer
 
-matplotlib.use("Agg")
-
 # ---------------------------------------------------------------------------
 # Font helpers
 # ---------------------------------------------------------------------------
@@ -35,8 +34,12 @@ _MONO_FONT_NAMES = [
 ]
 
 
+@lru_cache(maxsize=32)
 def _find_mono_font(size: int = 16) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-    """Return the first available monospace font, falling back to default."""
+    """Return the first available monospace font, falling back to default.
+
+    Cached per size so the font search only touches the filesystem once.
+    """
     for name in _MONO_FONT_NAMES:
         try:
             return ImageFont.truetype(name, size)
@@ -50,22 +53,24 @@ def _find_mono_font(size: int = 16) -> ImageFont.FreeTypeFont | ImageFont.ImageF
 # ---------------------------------------------------------------------------
 
 
-def render_code_image(
-    code: str,
-    language: str | None,
-    dest: Path,
-    *,
-    font_size: int = 16,
-    line_pad: int = 4,
-    pad: int = 24,
-) -> None:
-    """Render *code* as a syntax-highlighted PNG (light background)."""
+@lru_cache(maxsize=32)
+def _get_lexer(language: str) -> Lexer:
+    """Return a cached Pygments lexer for *language* (``text`` if unknown)."""
     try:
-        lexer = get_lexer_by_name(language) if language else guess_lexer(code)
+        return get_lexer_by_name(language)
     except Exception:
-        lexer = get_lexer_by_name("text")
+        return get_lexer_by_name("text")
 
-    formatter = ImageFormatter(
+
+@lru_cache(maxsize=8)
+def _get_formatter(font_size: int, line_pad: int, pad: int) -> ImageFormatter:
+    """Return a cached ImageFormatter (fonts are resolved once per config).
+
+    font_name stays a family name: a TTF path puts Pygments' FontManager in
+    single-file mode, which renders bold and italic styles with the regular
+    face.
+    """
+    return ImageFormatter(
         style="friendly",  # light Pygments style
         font_size=font_size,
         font_name="Consolas",
@@ -73,12 +78,36 @@ def render_code_image(
         line_pad=line_pad,
         image_pad=pad,
     )
+
+
+def render_code_image(
+    code: str,
+    language: str | None,
+    dest: Path,
+    *,
+    font_size: int = 16,
+    line_pad: int = 4,
+    pad: int = 24,
+) -> None:
+    """Render *code* as a syntax-highlighted PNG (light background)."""
+    if language:
+        lexer = _get_lexer(language)
+    else:
+        try:
+            lexer = guess_lexer(code)
+        except Exception:
+            lexer = _get_lexer("text")
+
+    formatter = _get_formatter(font_size, line_pad, pad)
+    # ImageFormatter appends to its drawables list on every format() call,
+    # so clear it before reusing the cached instance.
+    formatter.drawables = []
     raw_png = highlight(code, lexer, formatter)
     dest.write_bytes(raw_png)
 
 
 # ---------------------------------------------------------------------------
-# Table → image  (matplotlib)
+# Table → image  (Pillow)
 # ---------------------------------------------------------------------------
 
 
@@ -94,60 +123,63 @@ def _parse_md_table(table_text: str) -> tuple[list[str], list[list[str]]]:
     return headers, rows
 
 
-def render_table_image(table_text: str, dest: Path) -> None:
-    """Render a markdown table as a clean PNG using matplotlib."""
+def render_table_image(
+    table_text: str,
+    dest: Path,
+    *,
+    font_size: int = 22,
+    row_height: int = 60,
+    cell_pad: int = 18,
+) -> None:
+    """Render a markdown table as a clean PNG using Pillow."""
     headers, rows = _parse_md_table(table_text)
-
-    n_cols = len(headers)
-    n_rows = len(rows)
-
-    # --- Compute proportional column widths based on content ---------------
     all_rows = [headers] + rows
-    max_lens = []
-    for col_idx in range(n_cols):
-        col_max = max(len(row[col_idx]) for row in all_rows)
-        max_lens.append(max(col_max, 3))  # minimum width
-    total = sum(max_lens)
-    col_widths = [w / total for w in max_lens]
-
-    # --- Figure sizing proportional to content ----------------------------
-    fig_width = max(8, total * 0.12)
-    row_height = 0.4
-    fig_height = max(2, (n_rows + 1) * row_height + 0.5)
-
-    fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-    ax.axis("off")
-
-    tbl = ax.table(
-        cellText=rows,
-        colLabels=headers,
-        colWidths=col_widths,
-        cellLoc="left",
-        loc="center",
-    )
-
-    tbl.auto_set_font_size(False)
-    tbl.set_fontsize(11)
-    tbl.scale(1.0, 2.8)
-
-    # Style header row
-    for col_idx in range(n_cols):
-        cell = tbl[0, col_idx]
-        cell.set_facecolor("#e8e8e8")
-        cell.set_text_props(weight="bold")
-
-    # Light alternating rows
-    for row_idx in range(1, n_rows + 1):
-        for col_idx in range(n_cols):
-            cell = tbl[row_idx, col_idx]
-            if row_idx % 2 == 0:
-                cell.set_facecolor("#f9f9f9")
-            else:
-                cell.set_facecolor("#ffffff")
-
-    fig.tight_layout(pad=0.5)
-    fig.savefig(str(dest), dpi=150, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
+    font = _find_mono_font(font_size)
+
+    # --- Column widths from measured text (minimum of 3 characters) ---------
+    min_width = font.getlength("MMM")
+    col_widths = [
+        int(max(max(map(font.getlength, col)), min_width)) + 2 * cell_pad
+        for col in zip(*all_rows)
+    ]
+    width = sum(col_widths) + 1
+    height = len(all_rows) * row_height + 1
+
+    img = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+
+    for row_idx, row in enumerate(all_rows):
+        top = row_idx * row_height
+        # Header row grey, then light alternating data rows
+        if row_idx == 0:
+            fill = "#e8e8e8"
+        elif row_idx % 2 == 0:
+            fill = "#f9f9f9"
+        else:
+            fill = "#ffffff"
+
+        left = 0
+        for col_idx, cell in enumerate(row):
+            col_width = col_widths[col_idx]
+            draw.rectangle(
+                [left, top, left + col_width, top + row_height],
+                fill=fill,
+                outline="black",
+            )
+            draw.text(
+                (left + cell_pad, top + row_height // 2),
+                cell,
+                font=font,
+                fill="black",
+                anchor="lm",
+                # Faux-bold for the header row
+                stroke_width=1 if row_idx == 0 else 0,
+                stroke_fill="black",
+            )
+            left += col_width
+
+    # Build artifacts: favour fast encoding over file size
+    img.save(dest, "PNG", optimize=False, compress_level=1)
 
 
 # ---------------------------------------------------------------------------
@@ -155,53 +187,80 @@ def render_table_image(table_text: str, dest: Path) -> None:
 # ---------------------------------------------------------------------------
 
 # Regex patterns
-_FENCED_CODE = re.compile(r"^```(\w*)\n(.*?)^```", re.MULTILINE | re.DOTALL)
+# Fenced code block; DOTALL is scoped to the body so the table pattern's
+# ``.+`` still stops at line ends.
+_FENCED_CODE = r"^```(?P<lang>\w*)\n(?s:(?P<code>.*?))^```"
 
 # Markdown table: header row, separator row (with |---), and 1+ data rows.
-_TABLE = re.compile(
-    r"(^\|.+\|[ \t]*\n^\|[\s\-:|]+\|[ \t]*\n(?:^\|.+\|[ \t]*\n?)+)",
-    re.MULTILINE,
-)
+_TABLE = r"(?P<table>^\|.+\|[ \t]*\n^\|[\s\-:|]+\|[ \t]*\n(?:^\|.+\|[ \t]*\n?)+)"
+
+# Code blocks and tables in a single left-to-right scan. Code blocks are
+# tried first so pipe characters inside them are never treated as tables.
+_BLOCK = re.compile(rf"{_FENCED_CODE}|{_TABLE}", re.MULTILINE)
+
+# **bold** or __bold__ — whichever group matched is kept
+_BOLD = re.compile(r"\*\*(.+?)\*\*|__(.+?)__")
+
 
-_BOLD_ASTERISK = re.compile(r"\*\*(.+?)\*\*")
-_BOLD_UNDERSCORE = re.compile(r"__(.+?)__")
+# (kind, payload, language, dest) — kind is "code" or "table"
+RenderTask = tuple[str, str, str | None, Path]
+
+
+def _render_task(task: RenderTask) -> None:
+    """Render a single code block or table image (runs in a worker process)."""
+    kind, payload, language, dest = task
+    if kind == "code":
+        render_code_image(payload, language, dest)
+    else:
+        render_table_image(payload, dest)
 
 
 def convert(src: Path) -> Path:
     """Convert *src* markdown file to Substack format. Returns output path."""
-    text = src.read_text(encoding="utf-8")
+    text = src.read_bytes().decode("utf-8")
+    # read_bytes skips universal-newline translation; only normalize when needed
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     images_dir = src.parent / "images"
     images_dir.mkdir(exist_ok=True)
 
     code_counter = 0
     table_counter = 0
+    tasks: list[RenderTask] = []
 
-    # --- Replace code blocks first (they might contain pipe chars) ----------
+    # --- Replace code blocks and tables in one pass -------------------------
+    # Images are only queued here and rendered in parallel afterwards.
     def _replace_code(m: re.Match) -> str:
         nonlocal code_counter
         code_counter += 1
-        lang = m.group(1) or None
-        code = m.group(2)
+        lang = m.group("lang") or None
+        code = m.group("code")
         fname = f"code-{code_counter}.png"
-        render_code_image(code, lang, images_dir / fname)
+        tasks.append(("code", code, lang, images_dir / fname))
         alt = f"Code snippet{f' ({lang})' if lang else ''}"
         return f"![{alt}](./images/{fname})"
 
-    text = _FENCED_CODE.sub(_replace_code, text)
-
-    # --- Replace tables -------------------------------------------------------
     def _replace_table(m: re.Match) -> str:
         nonlocal table_counter
         table_counter += 1
         fname = f"table-{table_counter}.png"
-        render_table_image(m.group(0), images_dir / fname)
+        tasks.append(("table", m.group("table"), None, images_dir / fname))
         return f"![Table {table_counter}](./images/{fname})"
 
-    text = _TABLE.sub(_replace_table, text)
+    def _replace_block(m: re.Match) -> str:
+        if m.group("table") is not None:
+            return _replace_table(m)
+        return _replace_code(m)
+
+    text = _BLOCK.sub(_replace_block, text)
+
+    # --- Render queued images -------------------------------------------------
+    if tasks:
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(_render_task, tasks))
 
     # --- Strip bold -----------------------------------------------------------
-    text = _BOLD_ASTERISK.sub(r"\1", text)
-    text = _BOLD_UNDERSCORE.sub(r"\1", text)
+    text = _BOLD.sub(lambda m: m.group(1) or m.group(2), text)
 
     # --- Write output ---------------------------------------------------------
     out_path = src.with_stem(f"{src.stem}-substack")
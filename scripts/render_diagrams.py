@@ -1,9 +1,22 @@
-"""Render all blog diagrams as PNGs using mermaid-py."""
+"""Render all blog diagrams as PNGs using a local mermaid-cli (mmdc).
 
-from mermaid import Mermaid
-from mermaid.graph import Graph
+Requires mermaid-cli on PATH: npm install -g @mermaid-js/mermaid-cli
+"""
 
-OUTPUT_DIR = "c:/Users/sqr99/NewPythonProjects/VoiceAI/mcdonalds-drive-thru-bot/docs/blogs/images"
+import hashlib
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+OUTPUT_DIR = (
+    Path(__file__).resolve().parents[1]
+    / "docs"
+    / "blogs"
+    / "building-a-drive-thru-chatbot-with-langgraph"
+    / "images"
+)
 
 diagrams = {
     "01-system-overview": """\
@@ -202,11 +215,43 @@ graph TB
 """,
 }
 
-for name, source in diagrams.items():
-    g = Graph(name, source)
-    m = Mermaid(g)
-    path = f"{OUTPUT_DIR}/{name}.png"
-    m.to_png(path)
+
+def render(item: tuple[str, str], work_dir: Path) -> str:
+    """Render one diagram to PNG with a separate mmdc process.
+
+    Skipped when the PNG's ``.sha`` sidecar matches the current source.
+    """
+    name, source = item
+    path = OUTPUT_DIR / f"{name}.png"
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    sha_path = OUTPUT_DIR / f"{name}.png.sha"
+    if path.exists() and sha_path.exists() and sha_path.read_text() == digest:
+        print(f"Up to date: {path}")
+        return str(path)
+
+    src_path = work_dir / f"{name}.mmd"
+    src_path.write_text(source, encoding="utf-8")
+    try:
+        subprocess.run(
+            ["mmdc", "-i", str(src_path), "-o", str(path), "-b", "white"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        # Output is captured so concurrent renders don't interleave; surface
+        # mmdc's error (e.g. a diagram syntax error) before re-raising
+        print(f"Failed to render {name}:\n{e.stderr}", file=sys.stderr)
+        raise
+    sha_path.write_text(digest)
     print(f"Rendered: {path}")
+    return str(path)
+
+
+# Each mmdc call is its own process, so render all diagrams concurrently
+with tempfile.TemporaryDirectory() as tmp:
+    work_dir = Path(tmp)
+    with ThreadPoolExecutor(max_workers=len(diagrams)) as executor:
+        list(executor.map(lambda item: render(item, work_dir), diagrams.items()))
 
 print("All diagrams rendered.")
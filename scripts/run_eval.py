@@ -3,18 +3,37 @@
 Usage:
     uv run --package orchestrator python scripts/run_eval.py
     uv run --package orchestrator python scripts/run_eval.py --run-name "mistral-small-v2"
+    uv run --package orchestrator python scripts/run_eval.py --concurrency 4
+    uv run --package orchestrator python scripts/run_eval.py --cache
 
 Runs the LangGraph agent against every item in the Langfuse evaluation dataset,
 scores each result with deterministic evaluators, and prints a summary.
+
+With --cache (or EVAL_CACHE=1), task outputs are stored in .eval_cache.sqlite
+keyed by dataset item, model settings, the orchestrator source, the menu file
+and the system prompt, so re-runs that only change evaluators skip the LLM
+calls. Delete the file to force a fresh run.
 """
 
 import argparse
-import uuid
+import functools
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
+from pathlib import Path
 
 from langchain_core.messages import HumanMessage, ToolMessage
+from langfuse import Evaluation, Langfuse
+from langfuse.langchain import CallbackHandler
 from langgraph.checkpoint.memory import MemorySaver
 
+import orchestrator.graph
+import orchestrator.models
+import orchestrator.tools
 from orchestrator.config import get_settings
 from orchestrator.graph import _builder
 from orchestrator.models import Menu, Order
@@ -29,12 +48,12 @@ def _init_langfuse():
     if not settings.langfuse_public_key or not settings.langfuse_secret_key:
         raise RuntimeError("Langfuse credentials not configured in .env")
 
-    from langfuse import Langfuse
-
     langfuse = Langfuse(
         public_key=settings.langfuse_public_key,
         secret_key=settings.langfuse_secret_key,
         host=settings.langfuse_base_url,
+        flush_at=settings.langfuse_flush_at,
+        flush_interval=settings.langfuse_flush_interval,
     )
     return langfuse
 
@@ -45,51 +64,172 @@ DATASET_NAME = "drive-thru/order-correctness-v1"
 
 
 def _load_menu() -> Menu:
-    """Load the breakfast menu."""
+    """Load the breakfast menu (frozen, so one instance is shared by every task)."""
     settings = get_settings()
     return Menu.from_json_file(settings.menu_json_path)
 
 
-# Cache the menu so it's loaded once across all task invocations.
-# This is populated on the first task invocation before run_experiment()
-# starts concurrent execution, so subsequent reads are safe.
-_menu: Menu | None = None
+@dataclass(slots=True, frozen=True)
+class ModifierView:
+    """A modifier on an order item, as returned by eval_task."""
+
+    modifier_id: str
+    name: str
+
+
+@dataclass(slots=True, frozen=True)
+class OrderItemView:
+    """An order item as seen by the evaluators.
+
+    Langfuse and the task cache serialize it via asdict(), so it carries only
+    the traced output fields; the evaluators' comparison keys are computed
+    once per item in _index_items().
+    """
+
+    item_id: str
+    name: str
+    quantity: int
+    size: str | None
+    modifiers: tuple[ModifierView, ...]
+
+    @classmethod
+    def from_dict(cls, item: dict) -> "OrderItemView":
+        """Build a view from a dataset expected_items entry."""
+        modifiers = tuple(
+            ModifierView(modifier_id=m["modifier_id"], name=m.get("name", ""))
+            for m in item.get("modifiers", [])
+        )
+        return cls(
+            item_id=item["item_id"],
+            name=item["name"],
+            quantity=item["quantity"],
+            size=item.get("size"),
+            modifiers=modifiers,
+        )
+
+
+# Compiled once and shared by every task. Each dataset item runs on its own
+# thread_id, which keeps checkpointed state isolated between items.
+_graph = _builder.compile(checkpointer=MemorySaver())
+
+# Thread ids only need to be unique within a run; a counter keeps them
+# deterministic so traces are comparable across runs.
+_thread_counter = itertools.count()
+
+
+# ── Task Output Cache ───────────────────────────────────────────────────────
+
+CACHE_PATH = Path(__file__).resolve().parent.parent / ".eval_cache.sqlite"
+
+# Any edit to these modules invalidates cached outputs
+_SOURCE_FILES = (
+    orchestrator.graph.__file__,
+    orchestrator.models.__file__,
+    orchestrator.tools.__file__,
+)
 
 
-def _get_menu() -> Menu:
-    global _menu
-    if _menu is None:
-        _menu = _load_menu()
-    return _menu
+def _cache_fingerprint() -> str:
+    """Hash everything other than the dataset item that shapes a task output.
 
+    Covers the orchestrator source, the menu file, the resolved system prompt
+    template (Langfuse or fallback) and the model settings.
+    """
+    settings = get_settings()
+    h = hashlib.blake2b(digest_size=16)
+    for path in _SOURCE_FILES:
+        h.update(Path(path).read_bytes())
+        h.update(b"\0")
+    h.update(Path(settings.menu_json_path).read_bytes())
+    h.update(b"\0")
+    h.update(orchestrator.graph._get_system_prompt_template().encode())
+    h.update(b"\0")
+    h.update(f"{settings.mistral_model}|{settings.mistral_temperature}".encode())
+    return h.hexdigest()
+
+
+def _to_json(obj):
+    """json.dumps default= hook for OrderItemView."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class TaskCache:
+    """sqlite-backed store of eval_task outputs."""
+
+    def __init__(self, path: Path) -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS task_output (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        # Resolved once per run, so the prompt is fetched a single time
+        self._fingerprint = _cache_fingerprint()
+
+    def key(self, item) -> str:
+        """Cache key for a dataset item under the current run fingerprint."""
+        raw = "|".join([item.id, item.input["customer_utterance"], self._fingerprint])
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        row = self._conn.execute(
+            "SELECT value FROM task_output WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        output = json.loads(row[0])
+        output["order_items"] = [
+            OrderItemView.from_dict(i) for i in output["order_items"]
+        ]
+        return output
+
+    def set(self, key: str, output: dict) -> None:
+        value = json.dumps(output, default=_to_json, sort_keys=True)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO task_output (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
 
-def eval_task(*, item, **kwargs):
+
+def _bind(fn, **bound):
+    """functools.partial that keeps fn's __name__ (Langfuse logs it)."""
+    return functools.update_wrapper(functools.partial(fn, **bound), fn)
+
+
+async def eval_task(*, item, menu: Menu, cache: TaskCache | None = None, **kwargs):
     """Task function for the experiment runner.
 
-    Invokes the LangGraph agent with the customer utterance from the dataset
-    item. Returns a dict with the resulting order and tool call trace for
-    evaluators to score.
+    Async so run_experiment() can run items concurrently (up to
+    max_concurrency). Invokes the LangGraph agent with the customer utterance
+    from the dataset item. Returns a dict with the resulting order and tool
+    call trace for evaluators to score.
 
     Args:
         item: A DatasetItemClient from Langfuse. Has .input and .expected_output.
+        menu: The breakfast menu, loaded once in main() and bound via _bind().
+        cache: Optional TaskCache; on a hit the graph is not invoked.
 
     Returns:
         dict with keys:
-            - "order_items": list of dicts with item details from the final order
+            - "order_items": list of OrderItemView from the final order
             - "tool_calls": list of tool call names in execution order
             - "response": the final assistant message text
             - "item_count": total number of items in the order
     """
-    from langfuse.langchain import CallbackHandler
+    if cache is not None:
+        cache_key = cache.key(item)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
 
     customer_utterance = item.input["customer_utterance"]
-    menu = _get_menu()
-
-    # Compile a fresh graph with its own checkpointer for state isolation
-    graph = _builder.compile(checkpointer=MemorySaver())
 
     # Unique thread for this evaluation item
-    thread_id = f"eval-{uuid.uuid4()}"
+    thread_id = f"eval-{item.id}-{next(_thread_counter)}"
 
     # The CallbackHandler captures LangChain-specific observations (LLM calls,
     # tool calls, chain runs) and links them under the experiment trace created
@@ -103,7 +243,7 @@ def eval_task(*, item, **kwargs):
     }
 
     # Invoke the graph with the customer utterance
-    result = graph.invoke(
+    result = await _graph.ainvoke(
         {
             "messages": [HumanMessage(content=customer_utterance)],
             "menu": menu,
@@ -114,40 +254,49 @@ def eval_task(*, item, **kwargs):
 
     # Extract the final order state
     current_order = result["current_order"]
-    order_items = [
-        {
-            "item_id": item_obj.item_id,
-            "name": item_obj.name,
-            "quantity": item_obj.quantity,
-            "size": item_obj.size.value if item_obj.size else "regular",
-            "modifiers": [
-                {"modifier_id": m.modifier_id, "name": m.name}
-                for m in item_obj.modifiers
-            ],
-        }
-        for item_obj in current_order.items
-    ]
+    order_items = []
+    for item_obj in current_order.items:
+        modifiers = tuple(
+            ModifierView(modifier_id=m.modifier_id, name=m.name)
+            for m in item_obj.modifiers
+        )
+        order_items.append(
+            OrderItemView(
+                item_id=item_obj.item_id,
+                name=item_obj.name,
+                quantity=item_obj.quantity,
+                size=item_obj.size.value if item_obj.size else "regular",
+                modifiers=modifiers,
+            )
+        )
 
-    # Extract tool call sequence from messages
+    # Single reverse pass: the first assistant message seen is the final
+    # response, and tool calls are collected backwards then flipped into
+    # execution order
     tool_calls = []
-    for msg in result["messages"]:
-        if hasattr(msg, "tool_calls") and msg.tool_calls:
-            for tc in msg.tool_calls:
-                tool_calls.append(tc["name"])
-
-    # Get the final assistant response
-    response = ""
+    response = None
     for msg in reversed(result["messages"]):
-        if hasattr(msg, "content") and not isinstance(msg, (HumanMessage, ToolMessage)):
+        msg_tool_calls = getattr(msg, "tool_calls", None)
+        if msg_tool_calls:
+            tool_calls.extend(tc["name"] for tc in reversed(msg_tool_calls))
+        if (
+            response is None
+            and hasattr(msg, "content")
+            and not isinstance(msg, (HumanMessage, ToolMessage))
+        ):
             response = msg.content or ""
-            break
+    tool_calls.reverse()
+    response = response or ""
 
-    return {
+    output = {
         "order_items": order_items,
         "tool_calls": tool_calls,
         "response": response,
-        "item_count": sum(i["quantity"] for i in order_items),
+        "item_count": sum(i.quantity for i in order_items),
     }
+    if cache is not None:
+        cache.set(cache_key, output)
+    return output
 
 
 # ── Evaluators ──────────────────────────────────────────────────────────────
@@ -158,6 +307,35 @@ def eval_task(*, item, **kwargs):
 # ────────────────────────────────────────────────────────────────────────────
 
 
+def _index_items(items):
+    """Index OrderItemViews by item_id with comparison keys precomputed.
+
+    Each value is (item, lowercased name, frozenset of modifier_id), built
+    once per item so neither the fast path nor the scoring loop repeats the
+    string or set construction.
+    """
+    return {
+        item.item_id: (
+            item,
+            item.name.lower(),
+            frozenset(m.modifier_id for m in item.modifiers),
+        )
+        for item in items
+    }
+
+
+def _fast_match(exp, act) -> bool:
+    """True if act scores a perfect 1.0 against exp (both _index_items values)."""
+    exp_item, exp_name, exp_mod_ids = exp
+    act_item, act_name, act_mod_ids = act
+    return (
+        act_name == exp_name
+        and act_item.quantity == exp_item.quantity
+        and act_item.size == exp_item.size
+        and act_mod_ids == exp_mod_ids
+    )
+
+
 def order_correctness_evaluator(*, output, expected_output, **kwargs):
     """Score how well the actual order matches the expected order.
 
@@ -170,8 +348,6 @@ def order_correctness_evaluator(*, output, expected_output, **kwargs):
     - If expected has items but actual is empty: 0.0 (missed everything)
     - Otherwise: Jaccard-like score based on item matching by item_id
     """
-    from langfuse import Evaluation
-
     if output is None:
         return Evaluation(
             name="order_correctness", value=0.0, comment="Task returned None"
@@ -188,7 +364,7 @@ def order_correctness_evaluator(*, output, expected_output, **kwargs):
 
     # Expected empty but got items — hallucination
     if not expected_items and actual_items:
-        item_names = [i["name"] for i in actual_items]
+        item_names = [i.name for i in actual_items]
         return Evaluation(
             name="order_correctness",
             value=0.0,
@@ -206,60 +382,72 @@ def order_correctness_evaluator(*, output, expected_output, **kwargs):
 
     # Both have items — compute match score
     # Build lookup by item_id — order of items in lists does NOT matter
-    expected_by_id = {item["item_id"]: item for item in expected_items}
-    actual_by_id = {item["item_id"]: item for item in actual_items}
+    expected_by_id = _index_items(OrderItemView.from_dict(i) for i in expected_items)
+    actual_by_id = _index_items(actual_items)
+
+    # Perfect match (the common case for simple orders) — skip weighted scoring
+    if expected_by_id.keys() == actual_by_id.keys() and all(
+        _fast_match(exp, actual_by_id[item_id])
+        for item_id, exp in expected_by_id.items()
+    ):
+        comment = "; ".join(
+            f"{expected_by_id[item_id][0].name}: 1.00/1.0"
+            for item_id in sorted(expected_by_id)
+        )
+        return Evaluation(name="order_correctness", value=1.0, comment=comment)
 
-    all_ids = set(expected_by_id.keys()) | set(actual_by_id.keys())
-    total_score = 0.0
-    max_score = len(all_ids)
+    missing_ids = expected_by_id.keys() - actual_by_id.keys()
+
+    max_score = len(actual_by_id) + len(missing_ids)
+    # (item_id, detail, score) — sorted once by item_id for deterministic output
     details = []
 
-    for item_id in sorted(all_ids):  # sorted for deterministic comment output
-        exp = expected_by_id.get(item_id)
-        act = actual_by_id.get(item_id)
-
-        if exp and act:
-            # Item present in both — score match quality
-            item_score = 0.0
-
-            # Name match (0.4 weight)
-            if act["name"].lower() == exp["name"].lower():
-                item_score += 0.4
-
-            # Quantity match (0.3 weight)
-            if act["quantity"] == exp["quantity"]:
-                item_score += 0.3
-            else:
-                # Partial credit for close quantities
-                ratio = min(act["quantity"], exp["quantity"]) / max(
-                    act["quantity"], exp["quantity"]
-                )
-                item_score += 0.3 * ratio
-
-            # Size match (0.1 weight)
-            if act.get("size") == exp.get("size"):
-                item_score += 0.1
-
-            # Modifier match (0.2 weight) — uses SETS, order-independent
-            exp_mod_ids = {m["modifier_id"] for m in exp.get("modifiers", [])}
-            act_mod_ids = {m["modifier_id"] for m in act.get("modifiers", [])}
-            if not exp_mod_ids and not act_mod_ids:
-                item_score += 0.2  # Both have no modifiers — match
-            elif exp_mod_ids or act_mod_ids:
-                intersection = exp_mod_ids & act_mod_ids
-                union = exp_mod_ids | act_mod_ids
-                item_score += 0.2 * (len(intersection) / len(union))
-
-            total_score += item_score
-            details.append(f"{exp['name']}: {item_score:.2f}/1.0")
-
-        elif exp and not act:
-            details.append(f"{exp['name']}: MISSING from order")
-        elif act and not exp:
-            details.append(f"{act['name']}: UNEXPECTED in order")
+    for item_id, (act, act_name, act_mod_ids) in actual_by_id.items():
+        if item_id not in expected_by_id:
+            details.append((item_id, f"{act.name}: UNEXPECTED in order", 0.0))
+            continue
+        exp, exp_name, exp_mod_ids = expected_by_id[item_id]
+
+        # Item present in both — score match quality
+        item_score = 0.0
+
+        # Name match (0.4 weight)
+        if act_name == exp_name:
+            item_score += 0.4
+
+        # Quantity match (0.3 weight)
+        if act.quantity == exp.quantity:
+            item_score += 0.3
+        else:
+            # Partial credit for close quantities
+            ratio = min(act.quantity, exp.quantity) / max(act.quantity, exp.quantity)
+            item_score += 0.3 * ratio
+
+        # Size match (0.1 weight)
+        if act.size == exp.size:
+            item_score += 0.1
+
+        # Modifier match (0.2 weight) — uses SETS, order-independent
+        if not exp_mod_ids and not act_mod_ids:
+            item_score += 0.2  # Both have no modifiers — match
+        else:
+            intersection = exp_mod_ids & act_mod_ids
+            union = exp_mod_ids | act_mod_ids
+            item_score += 0.2 * (len(intersection) / len(union))
+
+        details.append((item_id, f"{exp.name}: {item_score:.2f}/1.0", item_score))
+
+    for item_id in missing_ids:
+        name = expected_by_id[item_id][0].name
+        details.append((item_id, f"{name}: MISSING from order", 0.0))
+
+    details.sort()
+    total_score = 0.0
+    for _, _, score in details:
+        total_score += score
+    comment = "; ".join(detail for _, detail, _ in details)
 
     final_score = total_score / max_score if max_score > 0 else 0.0
-    comment = "; ".join(details)
 
     return Evaluation(
         name="order_correctness", value=round(final_score, 3), comment=comment
@@ -278,8 +466,6 @@ def tool_call_accuracy_evaluator(*, output, expected_output, **kwargs):
     - If no items were expected: add_item_to_order should NOT appear
     - lookup_menu_item before add_item_to_order (protocol compliance)
     """
-    from langfuse import Evaluation
-
     if output is None:
         return Evaluation(
             name="tool_call_accuracy", value=0.0, comment="Task returned None"
@@ -288,9 +474,21 @@ def tool_call_accuracy_evaluator(*, output, expected_output, **kwargs):
     expected_items = expected_output.get("expected_items", [])
     tool_calls = output.get("tool_calls", [])
 
+    # Find the first lookup and first add in a single pass (-1 = never called)
+    first_lookup = first_add = -1
+    for idx, name in enumerate(tool_calls):
+        if first_lookup < 0 and name == "lookup_menu_item":
+            first_lookup = idx
+        elif first_add < 0 and name == "add_item_to_order":
+            first_add = idx
+        if first_lookup >= 0 and first_add >= 0:
+            break
+    has_lookup = first_lookup >= 0
+    has_add = first_add >= 0
+
     # No items expected — check that add_item_to_order was NOT called
     if not expected_items:
-        if "add_item_to_order" not in tool_calls:
+        if not has_add:
             return Evaluation(
                 name="tool_call_accuracy",
                 value=1.0,
@@ -303,9 +501,6 @@ def tool_call_accuracy_evaluator(*, output, expected_output, **kwargs):
         )
 
     # Items expected — check protocol
-    has_lookup = "lookup_menu_item" in tool_calls
-    has_add = "add_item_to_order" in tool_calls
-
     if not has_lookup and not has_add:
         return Evaluation(
             name="tool_call_accuracy",
@@ -328,9 +523,6 @@ def tool_call_accuracy_evaluator(*, output, expected_output, **kwargs):
         )
 
     # Check ordering: first lookup should come before first add
-    first_lookup = tool_calls.index("lookup_menu_item")
-    first_add = tool_calls.index("add_item_to_order")
-
     if first_lookup < first_add:
         return Evaluation(
             name="tool_call_accuracy", value=1.0, comment="Correct: lookup before add"
@@ -343,14 +535,13 @@ def tool_call_accuracy_evaluator(*, output, expected_output, **kwargs):
     )
 
 
-def no_hallucinated_items_evaluator(*, output, **kwargs):
+def no_hallucinated_items_evaluator(*, output, valid_ids: frozenset[str], **kwargs):
     """Check that no items outside the breakfast menu were added.
 
     ORDER-INDEPENDENT: Uses set membership check on item_ids.
-    Loads the menu and checks all item_ids in the order exist on the menu.
+    Checks all item_ids in the order against valid_ids, the menu's item_ids
+    (built once in main() and bound via _bind()).
     """
-    from langfuse import Evaluation
-
     if output is None:
         return Evaluation(
             name="no_hallucinated_items", value=0.0, comment="Task returned None"
@@ -362,17 +553,14 @@ def no_hallucinated_items_evaluator(*, output, **kwargs):
             name="no_hallucinated_items", value=1.0, comment="No items in order"
         )
 
-    menu = _get_menu()
-    valid_ids = {item.item_id for item in menu.items}
-
-    hallucinated = [item for item in actual_items if item["item_id"] not in valid_ids]
+    hallucinated = [item for item in actual_items if item.item_id not in valid_ids]
 
     if not hallucinated:
         return Evaluation(
             name="no_hallucinated_items", value=1.0, comment="All items are on the menu"
         )
 
-    names = [i["name"] for i in hallucinated]
+    names = [i.name for i in hallucinated]
     return Evaluation(
         name="no_hallucinated_items",
         value=0.0,
@@ -385,23 +573,23 @@ def no_hallucinated_items_evaluator(*, output, **kwargs):
 
 def avg_order_correctness_evaluator(*, item_results, **kwargs):
     """Compute average order_correctness across all items in the run."""
-    from langfuse import Evaluation
-
-    scores = [
-        ev.value
-        for result in item_results
-        for ev in result.evaluations
-        if ev.name == "order_correctness" and ev.value is not None
-    ]
-
-    if not scores:
+    # Running total/count — no intermediate list of scores
+    total = 0.0
+    n = 0
+    for result in item_results:
+        for ev in result.evaluations:
+            if ev.name == "order_correctness" and ev.value is not None:
+                total += ev.value
+                n += 1
+
+    if not n:
         return Evaluation(name="avg_order_correctness", value=None, comment="No scores")
 
-    avg = sum(scores) / len(scores)
+    avg = total / n
     return Evaluation(
         name="avg_order_correctness",
         value=round(avg, 3),
-        comment=f"Average order correctness: {avg:.1%} across {len(scores)} items",
+        comment=f"Average order correctness: {avg:.1%} across {n} items",
     )
 
 
@@ -415,6 +603,18 @@ def main() -> None:
         default=None,
         help="Name for this experiment run (default: auto-generated with timestamp)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of dataset items evaluated in parallel (default: 8)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=os.environ.get("EVAL_CACHE") == "1",
+        help=f"Reuse task outputs from {CACHE_PATH.name} (default: off, or EVAL_CACHE=1)",
+    )
     args = parser.parse_args()
 
     run_name = args.run_name or f"eval-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
@@ -425,28 +625,37 @@ def main() -> None:
     dataset = langfuse.get_dataset(DATASET_NAME)
     print(f"Dataset has {len(dataset.items)} items")
 
-    print(f"Running experiment: {run_name}")
+    # Load the menu once, up front; every task and evaluator shares it
+    menu = _load_menu()
+    valid_ids = frozenset(item.item_id for item in menu.items)
+    cache = TaskCache(CACHE_PATH) if args.cache else None
+
+    print(f"Running experiment: {run_name} (concurrency={args.concurrency})")
     print("This will invoke the LangGraph agent for each dataset item...")
     print()
 
     settings = get_settings()
-    result = dataset.run_experiment(
-        name=run_name,
-        description=f"Single-turn order correctness evaluation using {settings.mistral_model}",
-        task=eval_task,
-        evaluators=[
-            order_correctness_evaluator,
-            tool_call_accuracy_evaluator,
-            no_hallucinated_items_evaluator,
-        ],
-        run_evaluators=[avg_order_correctness_evaluator],
-        max_concurrency=1,
-        metadata={
-            "model": settings.mistral_model,
-            "temperature": settings.mistral_temperature,
-            "dataset": DATASET_NAME,
-        },
-    )
+    try:
+        result = dataset.run_experiment(
+            name=run_name,
+            description=f"Single-turn order correctness evaluation using {settings.mistral_model}",
+            task=_bind(eval_task, menu=menu, cache=cache),
+            evaluators=[
+                order_correctness_evaluator,
+                tool_call_accuracy_evaluator,
+                _bind(no_hallucinated_items_evaluator, valid_ids=valid_ids),
+            ],
+            run_evaluators=[avg_order_correctness_evaluator],
+            max_concurrency=args.concurrency,
+            metadata={
+                "model": settings.mistral_model,
+                "temperature": settings.mistral_temperature,
+                "dataset": DATASET_NAME,
+            },
+        )
+    finally:
+        if cache is not None:
+            cache.close()
 
     print()
     # Handle Windows encoding issues with emoji in format() output
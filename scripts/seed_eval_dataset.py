@@ -12,6 +12,8 @@ Each item has:
 Idempotent: each item has a deterministic id, so running twice upserts (no duplicates).
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from orchestrator.config import get_settings
 
 DATASET_NAME = "drive-thru/order-correctness-v1"
@@ -20,6 +22,25 @@ DATASET_DESCRIPTION = (
     "Tests whether the chatbot correctly adds items to the order "
     "based on a single customer utterance."
 )
+MAX_WORKERS = 8  # Concurrent create_dataset_item requests
+
+
+def _item(
+    item_id: str,
+    name: str,
+    quantity: int = 1,
+    size: str = "regular",
+    modifiers: list[dict] | None = None,
+) -> dict:
+    """Build an expected_items entry (regular size, no modifiers by default)."""
+    return {
+        "item_id": item_id,
+        "name": name,
+        "quantity": quantity,
+        "size": size,
+        "modifiers": modifiers if modifiers is not None else [],
+    }
+
 
 # ── Test Cases ──────────────────────────────────────────────────────────────
 # Each test case: (customer_utterance, expected_items, category, difficulty)
@@ -37,100 +58,44 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     # ── Simple single-item orders (easy) ──
     (
         "I'll have an Egg McMuffin",
-        [
-            {
-                "item_id": "egg-mcmuffin",
-                "name": "Egg McMuffin",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("egg-mcmuffin", "Egg McMuffin")],
         "simple_order",
         "easy",
     ),
     (
         "Can I get a Hash Brown please?",
-        [
-            {
-                "item_id": "hash-brown",
-                "name": "Hash Brown",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("hash-brown", "Hash Brown")],
         "simple_order",
         "easy",
     ),
     (
         "I'd like the Hotcakes",
-        [
-            {
-                "item_id": "hotcakes",
-                "name": "Hotcakes",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("hotcakes", "Hotcakes")],
         "simple_order",
         "easy",
     ),
     (
         "Give me a Sausage Burrito",
-        [
-            {
-                "item_id": "sausage-burrito",
-                "name": "Sausage Burrito",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("sausage-burrito", "Sausage Burrito")],
         "simple_order",
         "easy",
     ),
     (
         "I want the Fruit & Maple Oatmeal",
-        [
-            {
-                "item_id": "fruit-maple-oatmeal",
-                "name": "Fruit & Maple Oatmeal",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("fruit-maple-oatmeal", "Fruit & Maple Oatmeal")],
         "simple_order",
         "easy",
     ),
     # ── Quantities (easy-medium) ──
     (
         "Two hash browns please",
-        [
-            {
-                "item_id": "hash-brown",
-                "name": "Hash Brown",
-                "quantity": 2,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("hash-brown", "Hash Brown", quantity=2)],
         "quantity",
         "easy",
     ),
     (
         "I'll take three Sausage Biscuits",
-        [
-            {
-                "item_id": "sausage-biscuit",
-                "name": "Sausage Biscuit",
-                "quantity": 3,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("sausage-biscuit", "Sausage Biscuit", quantity=3)],
         "quantity",
         "medium",
     ),
@@ -138,20 +103,8 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     (
         "I'll have an Egg McMuffin and a Hash Brown",
         [
-            {
-                "item_id": "egg-mcmuffin",
-                "name": "Egg McMuffin",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            },
-            {
-                "item_id": "hash-brown",
-                "name": "Hash Brown",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            },
+            _item("egg-mcmuffin", "Egg McMuffin"),
+            _item("hash-brown", "Hash Brown"),
         ],
         "multi_item",
         "medium",
@@ -159,20 +112,8 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     (
         "Can I get two Sausage McMuffins and a Sausage Burrito",
         [
-            {
-                "item_id": "sausage-mcmuffin",
-                "name": "Sausage McMuffin",
-                "quantity": 2,
-                "size": "regular",
-                "modifiers": [],
-            },
-            {
-                "item_id": "sausage-burrito",
-                "name": "Sausage Burrito",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            },
+            _item("sausage-mcmuffin", "Sausage McMuffin", quantity=2),
+            _item("sausage-burrito", "Sausage Burrito"),
         ],
         "multi_item",
         "medium",
@@ -180,27 +121,9 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     (
         "I'd like a Steak & Egg McMuffin, two Hash Browns, and Hotcakes",
         [
-            {
-                "item_id": "steak-egg-mcmuffin",
-                "name": "Steak & Egg McMuffin",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            },
-            {
-                "item_id": "hash-brown",
-                "name": "Hash Brown",
-                "quantity": 2,
-                "size": "regular",
-                "modifiers": [],
-            },
-            {
-                "item_id": "hotcakes",
-                "name": "Hotcakes",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            },
+            _item("steak-egg-mcmuffin", "Steak & Egg McMuffin"),
+            _item("hash-brown", "Hash Brown", quantity=2),
+            _item("hotcakes", "Hotcakes"),
         ],
         "multi_item",
         "medium",
@@ -209,13 +132,11 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     (
         "Sausage McMuffin with egg please",
         [
-            {
-                "item_id": "sausage-mcmuffin",
-                "name": "Sausage McMuffin",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [{"modifier_id": "egg", "name": "Egg"}],
-            }
+            _item(
+                "sausage-mcmuffin",
+                "Sausage McMuffin",
+                modifiers=[{"modifier_id": "egg", "name": "Egg"}],
+            )
         ],
         "modifier",
         "medium",
@@ -223,13 +144,11 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     (
         "I'll have a Sausage Biscuit with egg whites",
         [
-            {
-                "item_id": "sausage-biscuit",
-                "name": "Sausage Biscuit",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [{"modifier_id": "egg-whites", "name": "Egg Whites"}],
-            }
+            _item(
+                "sausage-biscuit",
+                "Sausage Biscuit",
+                modifiers=[{"modifier_id": "egg-whites", "name": "Egg Whites"}],
+            )
         ],
         "modifier",
         "medium",
@@ -237,13 +156,11 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     (
         "Hotcakes with sausage",
         [
-            {
-                "item_id": "hotcakes",
-                "name": "Hotcakes",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [{"modifier_id": "sausage", "name": "Sausage"}],
-            }
+            _item(
+                "hotcakes",
+                "Hotcakes",
+                modifiers=[{"modifier_id": "sausage", "name": "Sausage"}],
+            )
         ],
         "modifier",
         "medium",
@@ -289,35 +206,19 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     # ── Informal / colloquial phrasing (medium-hard) ──
     (
         "Lemme get uhh two of those egg mcmuffins",
-        [
-            {
-                "item_id": "egg-mcmuffin",
-                "name": "Egg McMuffin",
-                "quantity": 2,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("egg-mcmuffin", "Egg McMuffin", quantity=2)],
         "informal",
         "medium",
     ),
     (
         "yeah gimme a sausage mcmuffin with egg and a hash brown",
         [
-            {
-                "item_id": "sausage-mcmuffin",
-                "name": "Sausage McMuffin",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [{"modifier_id": "egg", "name": "Egg"}],
-            },
-            {
-                "item_id": "hash-brown",
-                "name": "Hash Brown",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            },
+            _item(
+                "sausage-mcmuffin",
+                "Sausage McMuffin",
+                modifiers=[{"modifier_id": "egg", "name": "Egg"}],
+            ),
+            _item("hash-brown", "Hash Brown"),
         ],
         "informal",
         "hard",
@@ -331,15 +232,7 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     ),
     (
         "Give me some bacon",
-        [
-            {
-                "item_id": "bacon",
-                "name": "Bacon",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            }
-        ],
+        [_item("bacon", "Bacon")],
         "ambiguous",
         "hard",
     ),
@@ -347,20 +240,13 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     (
         "Two Sausage Biscuits with egg and a Sausage Burrito",
         [
-            {
-                "item_id": "sausage-biscuit",
-                "name": "Sausage Biscuit",
-                "quantity": 2,
-                "size": "regular",
-                "modifiers": [{"modifier_id": "egg", "name": "Egg"}],
-            },
-            {
-                "item_id": "sausage-burrito",
-                "name": "Sausage Burrito",
-                "quantity": 1,
-                "size": "regular",
-                "modifiers": [],
-            },
+            _item(
+                "sausage-biscuit",
+                "Sausage Biscuit",
+                quantity=2,
+                modifiers=[{"modifier_id": "egg", "name": "Egg"}],
+            ),
+            _item("sausage-burrito", "Sausage Burrito"),
         ],
         "complex",
         "hard",
@@ -368,20 +254,8 @@ TEST_CASES: list[tuple[str, list[dict], str, str]] = [
     (
         "I'd like three hash browns and two Egg McMuffins",
         [
-            {
-                "item_id": "hash-brown",
-                "name": "Hash Brown",
-                "quantity": 3,
-                "size": "regular",
-                "modifiers": [],
-            },
-            {
-                "item_id": "egg-mcmuffin",
-                "name": "Egg McMuffin",
-                "quantity": 2,
-                "size": "regular",
-                "modifiers": [],
-            },
+            _item("hash-brown", "Hash Brown", quantity=3),
+            _item("egg-mcmuffin", "Egg McMuffin", quantity=2),
         ],
         "complex",
         "hard",
@@ -403,6 +277,8 @@ def main() -> None:
         public_key=settings.langfuse_public_key,
         secret_key=settings.langfuse_secret_key,
         host=settings.langfuse_base_url,
+        flush_at=settings.langfuse_flush_at,
+        flush_interval=settings.langfuse_flush_interval,
     )
 
     # Create the dataset (idempotent — Langfuse upserts by name)
@@ -419,11 +295,10 @@ def main() -> None:
     )
 
     # Add test cases as dataset items
-    # Each item has a deterministic id so re-running upserts instead of duplicating
-    for i, (utterance, expected_items, category, difficulty) in enumerate(TEST_CASES):
-        print(
-            f"  [{i + 1}/{len(TEST_CASES)}] {category}/{difficulty}: {utterance[:50]}..."
-        )
+    # Each item has a deterministic id so re-running upserts instead of duplicating.
+    # The SDK has no bulk endpoint, so items are created in parallel threads.
+    def _create_one(i: int) -> None:
+        utterance, expected_items, category, difficulty = TEST_CASES[i]
         langfuse.create_dataset_item(
             id=f"order-correctness-{i:03d}",
             dataset_name=DATASET_NAME,
@@ -436,6 +311,16 @@ def main() -> None:
             },
         )
 
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(_create_one, i): i for i in range(len(TEST_CASES))}
+        for done, future in enumerate(as_completed(futures), start=1):
+            future.result()
+            i = futures[future]
+            utterance, _, category, difficulty = TEST_CASES[i]
+            print(
+                f"  [{done}/{len(TEST_CASES)}] {category}/{difficulty}: {utterance[:50]}..."
+            )
+
     langfuse.flush()
     print(f"\nDone! {len(TEST_CASES)} items seeded to '{DATASET_NAME}'")
     print("View in Langfuse UI: Datasets > drive-thru/order-correctness-v1")
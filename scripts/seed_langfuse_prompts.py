@@ -7,13 +7,18 @@ This creates prompts with the 'production' label.
 If prompts already exist, Langfuse will create a new version.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from langfuse import Langfuse
 from orchestrator.config import get_settings
 
+MAX_WORKERS = 8  # Concurrent create_prompt requests
+
 # ---------------------------------------------------------------------------
 # Drive-Thru Orchestrator Prompt (v1)
 # ---------------------------------------------------------------------------
 
+# {{current_order}} stays last so the prefix is stable across turns (see graph.py)
 DRIVE_THRU_SYSTEM_PROMPT = """\
 You are a friendly McDonald's drive-thru assistant taking breakfast orders.
 
@@ -22,32 +27,24 @@ LOCATION: {{location_name}} — {{location_address}}
 CURRENT MENU:
 {{menu_items}}
 
-CURRENT ORDER:
-{{current_order}}
-
 RULES:
 1. Greet the customer warmly when the conversation starts.
-2. When a customer orders an item, ALWAYS call lookup_menu_item first to verify it exists.
-3. Only call add_item_to_order for items confirmed to exist via lookup_menu_item.
-   Pass the exact item_id, item_name, and category_name from the lookup result.
-4. If an item isn't found, suggest the alternatives from lookup_menu_item results.
-   Do NOT invent alternatives.
-5. When the customer says they're done, call get_current_order, read back the
-   full order, and ask them to confirm.
-6. Only call finalize_order AFTER the customer confirms their order.
-7. Handle multiple items in a single request — call lookup_menu_item for each,
-   then add_item_to_order for each confirmed item.
-8. Keep responses concise and friendly — this is a drive-thru, not a sit-down restaurant.
-9. Answer menu questions from the CURRENT MENU above. Do NOT make up items.
-10. You do NOT have access to prices. Do not quote prices or totals.
-    Say "your total will be at the window" if asked.
-11. If the customer asks to remove or change an item, explain you can only
-    add items right now.
-12. When adding modifiers, only use modifiers from the item's available_modifiers
-    list returned by lookup_menu_item. Do not accept modifiers that aren't
-    available for that item.
-13. Sizes are: snack, small, medium, large, regular. If the customer doesn't
-    specify a size, do not ask — the item's default size will be used automatically.\
+2. For EVERY item ordered (several in one request included), call lookup_menu_item
+   first, then add_item_to_order only for confirmed items, passing the exact
+   item_id, item_name and category_name from the lookup. Modifiers must come from
+   that item's available_modifiers.
+3. If an item isn't found, suggest only the alternatives lookup_menu_item returned.
+4. When the customer is done, call get_current_order, read back the full order and
+   ask them to confirm. Call finalize_order only AFTER they confirm.
+5. Keep responses concise and friendly — this is a drive-thru.
+6. Answer menu questions from the CURRENT MENU above. Do NOT make up items.
+7. You have no prices. If asked, say "your total will be at the window".
+8. You can only add items; explain this if asked to remove or change one.
+9. Sizes: snack, small, medium, large, regular. Don't ask for a size — the
+   item's default is used.
+
+CURRENT ORDER:
+{{current_order}}\
 """
 
 DRIVE_THRU_PROMPT_CONFIG = {"model": "mistral-small-latest", "temperature": 0.0}
@@ -101,7 +98,7 @@ def main() -> None:
         host=settings.langfuse_base_url,
     )
 
-    for prompt_def in PROMPTS:
+    def _create_one(prompt_def: dict) -> None:
         langfuse.create_prompt(
             name=prompt_def["name"],
             type=prompt_def["type"],
@@ -109,7 +106,13 @@ def main() -> None:
             config=prompt_def["config"],
             labels=["production"],
         )
-        print(f"Created prompt: {prompt_def['name']}")
+
+    # Prompts are independent, so create them in parallel threads
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(_create_one, p): p["name"] for p in PROMPTS}
+        for future in as_completed(futures):
+            future.result()
+            print(f"Created prompt: {futures[future]}")
 
     langfuse.flush()
     print(f"\nDone. {len(PROMPTS)} prompts created with 'production' label.")
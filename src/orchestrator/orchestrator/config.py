@@ -44,6 +44,9 @@ class Settings(BaseSettings):
     langfuse_public_key: str = ""
     langfuse_secret_key: str = ""
     langfuse_base_url: str = "https://cloud.langfuse.com"
+    # Span batching; None keeps the SDK defaults (512 spans / 5 seconds)
+    langfuse_flush_at: int | None = None
+    langfuse_flush_interval: float | None = None
 
 
 @lru_cache(maxsize=1)
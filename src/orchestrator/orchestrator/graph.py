@@ -7,15 +7,13 @@ fetched from Langfuse prompt management and compiled with runtime variables.
 Exported as `graph` for langgraph.json.
 """
 
-import json
 import operator
 import re
 from functools import lru_cache
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
+import orjson
 from langchain_core.messages import SystemMessage, ToolMessage
-from langchain_mistralai import ChatMistralAI
-from langfuse import Langfuse
 from langgraph.graph import END, START, MessagesState, StateGraph
 from langgraph.prebuilt import ToolNode
 from langgraph.types import RetryPolicy
@@ -31,6 +29,10 @@ from .tools import (
     lookup_menu_item,
 )
 
+if TYPE_CHECKING:
+    from langfuse import Langfuse
+    from langgraph.graph.state import CompiledStateGraph
+
 # ---------------------------------------------------------------------------
 # State Schema
 # ---------------------------------------------------------------------------
@@ -54,7 +56,15 @@ class DriveThruState(MessagesState):
 
 PROMPT_NAME = "drive-thru/orchestrator"
 
-# Fallback prompt used if Langfuse is unavailable (e.g., no API keys configured)
+# After this many seconds the Langfuse SDK serves the cached prompt once more
+# and refreshes it in a background task, so no turn blocks on the network
+# after the first fetch.
+PROMPT_CACHE_TTL_SECONDS = 60
+
+# Fallback prompt used if Langfuse is unavailable (e.g., no API keys configured).
+# {{current_order}} is the only per-turn variable and stays last, so everything
+# before it is byte-identical across turns and eligible for provider-side
+# prompt-prefix caching.
 FALLBACK_SYSTEM_PROMPT = """\
 You are a friendly McDonald's drive-thru assistant taking breakfast orders.
 
@@ -63,43 +73,74 @@ LOCATION: {{location_name}} — {{location_address}}
 CURRENT MENU:
 {{menu_items}}
 
-CURRENT ORDER:
-{{current_order}}
-
 RULES:
 1. Greet the customer warmly when the conversation starts.
-2. When a customer orders an item, ALWAYS call lookup_menu_item first to verify it exists.
-3. Only call add_item_to_order for items confirmed to exist via lookup_menu_item.
-   Pass the exact item_id, item_name, and category_name from the lookup result.
-4. If an item isn't found, suggest the alternatives from lookup_menu_item results.
-   Do NOT invent alternatives.
-5. When the customer says they're done, call get_current_order, read back the
-   full order, and ask them to confirm.
-6. Only call finalize_order AFTER the customer confirms their order.
-7. Handle multiple items in a single request — call lookup_menu_item for each,
-   then add_item_to_order for each confirmed item.
-8. Keep responses concise and friendly — this is a drive-thru, not a sit-down restaurant.
-9. Answer menu questions from the CURRENT MENU above. Do NOT make up items.
-10. You do NOT have access to prices. Do not quote prices or totals.
-    Say "your total will be at the window" if asked.
-11. If the customer asks to remove or change an item, explain you can only
-    add items right now.
-12. When adding modifiers, only use modifiers from the item's available_modifiers
-    list returned by lookup_menu_item. Do not accept modifiers that aren't
-    available for that item.
-13. Sizes are: snack, small, medium, large, regular. If the customer doesn't
-    specify a size, do not ask — the item's default size will be used automatically.
-14. ALWAYS start your response with a <reasoning> tag explaining your decision.
-    If you are calling tools, explain which tools you chose and why.
-    If you are responding directly, explain why no tool call is needed.
+2. For EVERY item ordered (several in one request included), call lookup_menu_item
+   first, then add_item_to_order only for confirmed items, passing the exact
+   item_id, item_name and category_name from the lookup. Modifiers must come from
+   that item's available_modifiers.
+3. If an item isn't found, suggest only the alternatives lookup_menu_item returned.
+4. When the customer is done, call get_current_order, read back the full order and
+   ask them to confirm. Call finalize_order only AFTER they confirm.
+5. Keep responses concise and friendly — this is a drive-thru.
+6. Answer menu questions from the CURRENT MENU above. Do NOT make up items.
+7. You have no prices. If asked, say "your total will be at the window".
+8. You can only add items; explain this if asked to remove or change one.
+9. Sizes: snack, small, medium, large, regular. Don't ask for a size — the
+   item's default is used.
+10. ALWAYS start your response with a <reasoning> tag explaining your decision:
+    which tools you chose and why, or why no tool call is needed.
     Example: <reasoning>Customer asked for an Egg McMuffin. I need to call
     lookup_menu_item to verify it exists before adding it.</reasoning>
-    The reasoning tag MUST appear before any other content in your response.\
+
+CURRENT ORDER:
+{{current_order}}\
 """
 
 
+@lru_cache(maxsize=1)
+def _get_langfuse_client() -> "Langfuse":
+    """Create the Langfuse client used for prompt fetching (once).
+
+    langfuse is imported here rather than at module level so importing the
+    graph (tests, LangGraph Studio) doesn't pay for the SDK and its
+    OpenTelemetry stack until a prompt is actually fetched.
+    """
+    from langfuse import Langfuse
+
+    settings = get_settings()
+    return Langfuse(
+        public_key=settings.langfuse_public_key,
+        secret_key=settings.langfuse_secret_key,
+        host=settings.langfuse_base_url,
+    )
+
+
+def _fetch_prompt_template() -> str:
+    """Fetch the production system prompt template from Langfuse.
+
+    Served from the SDK prompt cache with an explicit TTL
+    (PROMPT_CACHE_TTL_SECONDS); expired entries are returned stale and
+    revalidated in the background. Raises if there is no cached copy and
+    the fetch fails.
+    """
+    prompt = _get_langfuse_client().get_prompt(
+        PROMPT_NAME,
+        label="production",
+        cache_ttl_seconds=PROMPT_CACHE_TTL_SECONDS,
+    )
+    logger.debug("Using system prompt from Langfuse: {}", PROMPT_NAME)
+    # For chat prompts, extract the system message content
+    if isinstance(prompt.prompt, list):
+        for msg in prompt.prompt:
+            if msg.get("role") == "system":
+                return msg["content"]
+    # For text prompts, return directly
+    return prompt.prompt
+
+
 def _get_system_prompt_template() -> str:
-    """Fetch the system prompt template from Langfuse.
+    """Return the system prompt template.
 
     Falls back to FALLBACK_SYSTEM_PROMPT if Langfuse is unavailable
     (no API keys, network error, prompt not seeded yet).
@@ -112,20 +153,7 @@ def _get_system_prompt_template() -> str:
         return FALLBACK_SYSTEM_PROMPT
 
     try:
-        langfuse = Langfuse(
-            public_key=settings.langfuse_public_key,
-            secret_key=settings.langfuse_secret_key,
-            host=settings.langfuse_base_url,
-        )
-        prompt = langfuse.get_prompt(PROMPT_NAME, label="production")
-        logger.info("Fetched system prompt from Langfuse: {}", PROMPT_NAME)
-        # For chat prompts, extract the system message content
-        if isinstance(prompt.prompt, list):
-            for msg in prompt.prompt:
-                if msg.get("role") == "system":
-                    return msg["content"]
-        # For text prompts, return directly
-        return prompt.prompt
+        return _fetch_prompt_template()
     except Exception:
         logger.warning(
             "Failed to fetch prompt from Langfuse — using fallback",
@@ -134,6 +162,19 @@ def _get_system_prompt_template() -> str:
         return FALLBACK_SYSTEM_PROMPT
 
 
+@lru_cache(maxsize=8)
+def _format_menu_items(menu: Menu) -> str:
+    """Format the menu block of the system prompt.
+
+    Menu is frozen and hashable, so the block is built once per menu rather
+    than on every turn; only the current order changes between turns.
+    """
+    return "(name | category | default size)\n" + "\n".join(
+        f"- {item.name} | {item.category_name.value} | {item.default_size.value}"
+        for item in menu.items
+    )
+
+
 # ---------------------------------------------------------------------------
 # LLM + Tools (lazy initialization)
 # ---------------------------------------------------------------------------
@@ -148,8 +189,11 @@ def _get_orchestrator_llm():
     Lazy-initialized via @lru_cache so the LLM is only created when
     the graph is first invoked, NOT at import time. This allows
     graph.py to be imported without MISTRAL_API_KEY being set
-    (important for tests and __init__.py imports).
+    (important for tests and __init__.py imports). langchain_mistralai is
+    imported here for the same reason.
     """
+    from langchain_mistralai import ChatMistralAI
+
     settings = get_settings()
     logger.info(
         "Initializing LLM: model={}, temperature={}",
@@ -169,6 +213,9 @@ def _get_orchestrator_llm():
 # ---------------------------------------------------------------------------
 
 _REASONING_PATTERN = re.compile(r"<reasoning>(.*?)</reasoning>", re.DOTALL)
+_TEMPLATE_VARS_PATTERN = re.compile(
+    r"\{\{(location_name|location_address|menu_items|current_order)\}\}"
+)
 
 
 def _extract_reasoning(content: str) -> tuple[str, str]:
@@ -179,14 +226,55 @@ def _extract_reasoning(content: str) -> tuple[str, str]:
         reasoning (empty string if no tag found), cleaned_content is the
         original content with the <reasoning> tag removed.
     """
+    # Most replies carry no tag; a substring check is cheaper than a search
+    if "<reasoning>" not in content:
+        return "", content
     match = _REASONING_PATTERN.search(content)
     if not match:
         return "", content
     reasoning_text = match.group(1).strip()
-    cleaned = _REASONING_PATTERN.sub("", content).strip()
+    # Resume from the end of the first match instead of rescanning the
+    # prefix; any further tags are still stripped
+    cleaned = (
+        content[: match.start()] + _REASONING_PATTERN.sub("", content[match.end() :])
+    ).strip()
     return reasoning_text, cleaned
 
 
+@lru_cache(maxsize=64)
+def _format_order_lines(
+    lines: tuple[tuple[int, str, str, tuple[str, ...]], ...],
+) -> str:
+    return (
+        "\n".join(
+            f"- {quantity}x {name} ({size})"
+            + (f" [{', '.join(modifiers)}]" if modifiers else "")
+            for quantity, name, size, modifiers in lines
+        )
+        or "Empty"
+    )
+
+
+def _format_order(order: Order) -> str:
+    """Format the current-order block of the system prompt.
+
+    Order is mutable and unhashable, so the cache is keyed on a tuple of the
+    fields that appear in the output. The order often stays the same for
+    several turns while the customer deliberates.
+    """
+    return _format_order_lines(
+        tuple(
+            (
+                item.quantity,
+                item.name,
+                item.size.value,
+                tuple(m.name for m in item.modifiers),
+            )
+            for item in order.items
+        )
+    )
+
+
 def orchestrator_node(state: DriveThruState) -> dict:
     """Central orchestrator node. Reasons about the conversation and decides
     what tools to call.
@@ -198,40 +286,26 @@ def orchestrator_node(state: DriveThruState) -> dict:
 
     # Format location info
     location = state["menu"].location
-    location_address = (
-        f"{location.address}, {location.city}, {location.state} {location.zip}"
-    )
-
-    # Format menu items for the prompt
-    menu_items = "\n".join(
-        f"- {item.name} [{item.category_name.value}] "
-        f"(default size: {item.default_size.value})"
-        for item in state["menu"].items
-    )
 
-    # Format current order for the prompt
-    current_items = (
-        "\n".join(
-            f"- {item.quantity}x {item.name} ({item.size.value})"
-            + (
-                f" [{', '.join(m.name for m in item.modifiers)}]"
-                if item.modifiers
-                else ""
-            )
-            for item in state["current_order"].items
-        )
-        or "Empty"
+    # Format menu items for the prompt (cached per menu)
+    menu_items = _format_menu_items(state["menu"])
+
+    # Format current order for the prompt (cached while the order is unchanged)
+    current_items = _format_order(state["current_order"])
+
+    # Compile the prompt template (replace {{var}} with values in one pass)
+    template_vars = {
+        "location_name": location.name,
+        "location_address": location.full_address,
+        "menu_items": menu_items,
+        "current_order": current_items,
+    }
+    system_content = _TEMPLATE_VARS_PATTERN.sub(
+        lambda m: template_vars[m.group(1)], prompt_template
     )
 
-    # Compile the prompt template (replace {{var}} with values)
-    system_content = (
-        prompt_template.replace("{{location_name}}", location.name)
-        .replace("{{location_address}}", location_address)
-        .replace("{{menu_items}}", menu_items)
-        .replace("{{current_order}}", current_items)
-    )
-
-    messages = [SystemMessage(content=system_content)] + state["messages"]
+    # One new list per turn; the system message is never stored in state
+    messages = [SystemMessage(content=system_content), *state["messages"]]
     logger.debug("Invoking orchestrator LLM with {} messages", len(messages))
     response = _get_orchestrator_llm().invoke(messages)
 
@@ -291,6 +365,18 @@ def should_continue(state: DriveThruState) -> str:
     return "respond"
 
 
+def _latest_tool_batch(messages: list) -> list:
+    """Return the messages after the last AIMessage that made tool calls.
+
+    Scans backwards, so the cost is the size of the latest tool batch rather
+    than the length of the conversation. Returns [] if no tool calls exist.
+    """
+    for i in range(len(messages) - 1, -1, -1):
+        if getattr(messages[i], "tool_calls", None):
+            return messages[i + 1 :]
+    return []
+
+
 def update_order(state: DriveThruState) -> dict:
     """Process tool results and update current_order.
 
@@ -301,14 +387,8 @@ def update_order(state: DriveThruState) -> dict:
     current_order = state["current_order"]
     menu = state["menu"]
 
-    # Find the last AIMessage index to only process new tool results
-    last_ai_idx = -1
-    for i, msg in enumerate(state["messages"]):
-        if hasattr(msg, "tool_calls") and msg.tool_calls:
-            last_ai_idx = i
-
     # Only process ToolMessages after the last AIMessage
-    recent_messages = state["messages"][last_ai_idx + 1 :] if last_ai_idx >= 0 else []
+    recent_messages = _latest_tool_batch(state["messages"])
 
     for msg in recent_messages:
         if not isinstance(msg, ToolMessage):
@@ -317,14 +397,12 @@ def update_order(state: DriveThruState) -> dict:
             continue
 
         result = (
-            json.loads(msg.content) if isinstance(msg.content, str) else msg.content
+            orjson.loads(msg.content) if isinstance(msg.content, str) else msg.content
         )
         if not result.get("added"):
             continue
 
-        menu_item = next(
-            (i for i in menu.items if i.item_id == result["item_id"]), None
-        )
+        menu_item = menu.item_by_id.get(result["item_id"])
         if not menu_item:
             continue
 
@@ -361,14 +439,8 @@ def should_end_after_update(state: DriveThruState) -> str:
         "end" — finalize_order was called, conversation is done
         "continue" — normal flow, loop back to orchestrator
     """
-    # Find the last AIMessage index
-    last_ai_idx = -1
-    for i, msg in enumerate(state["messages"]):
-        if hasattr(msg, "tool_calls") and msg.tool_calls:
-            last_ai_idx = i
-
     # Check recent ToolMessages for finalize_order
-    recent_messages = state["messages"][last_ai_idx + 1 :] if last_ai_idx >= 0 else []
+    recent_messages = _latest_tool_batch(state["messages"])
     for msg in recent_messages:
         if isinstance(msg, ToolMessage) and msg.name == "finalize_order":
             logger.info("should_end_after_update -> end (finalize_order detected)")
@@ -420,6 +492,21 @@ _builder.add_conditional_edges(
     },
 )
 
-# Compile without checkpointer — LangGraph Studio provides its own.
-# For CLI usage, main.py compiles from _builder with a MemorySaver.
-graph = _builder.compile()
+
+@lru_cache(maxsize=1)
+def get_graph() -> "CompiledStateGraph":
+    """Compile the Studio graph on first use (once).
+
+    Compiled without a checkpointer — LangGraph Studio provides its own.
+    For CLI usage, main.py compiles from _builder with a MemorySaver.
+    """
+    return _builder.compile()
+
+
+def __getattr__(name: str):
+    # Keep ``orchestrator.graph:graph`` (langgraph.json) and
+    # ``from orchestrator.graph import graph`` working without compiling
+    # at import time.
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
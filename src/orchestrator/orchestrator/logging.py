@@ -22,10 +22,13 @@ def setup_logging(level: str = "DEBUG") -> None:
     # Remove the default stderr handler so we can reconfigure it
     logger.remove()
 
-    # Sink 1: stderr — human-readable, colored
+    # Sink 1: stderr — human-readable, colored. No extended tracebacks or
+    # variable values here; the file sink keeps the full detail.
     logger.add(
         sys.stderr,
         level=level,
+        backtrace=False,
+        diagnose=False,
         format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
     )
 
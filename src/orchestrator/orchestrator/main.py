@@ -11,7 +11,12 @@ from langgraph.checkpoint.memory import MemorySaver
 from loguru import logger
 
 from .config import get_settings
-from .graph import _builder
+from .graph import (
+    _builder,
+    _get_langfuse_client,
+    _get_orchestrator_llm,
+    _get_system_prompt_template,
+)
 from .logging import setup_logging
 from .models import Menu, Order
 
@@ -25,15 +30,11 @@ def _create_langfuse_handler():
     if not settings.langfuse_public_key or not settings.langfuse_secret_key:
         return None
 
-    from langfuse import Langfuse
     from langfuse.langchain import CallbackHandler
 
-    # Initialize the Langfuse singleton client with credentials
-    Langfuse(
-        public_key=settings.langfuse_public_key,
-        secret_key=settings.langfuse_secret_key,
-        host=settings.langfuse_base_url,
-    )
+    # Initialize the Langfuse singleton client with credentials (shared with
+    # the prompt fetch in graph.py)
+    _get_langfuse_client()
 
     return CallbackHandler()
 
@@ -46,6 +47,11 @@ def main() -> None:
     setup_logging(level=settings.log_level)
     logger.info("Starting drive-thru chatbot CLI")
 
+    # Pre-fetch the system prompt and build the LLM client up front so the
+    # first turn doesn't pay for either
+    _get_system_prompt_template()
+    _get_orchestrator_llm()
+
     # Load menu from JSON
     menu = Menu.from_json_file(settings.menu_json_path)
     logger.info("Menu loaded: {} ({} items)", menu.menu_name, len(menu.items))
@@ -119,7 +125,7 @@ def main() -> None:
 
         # Print the assistant's response
         last_msg = result["messages"][-1]
-        logger.debug("Bot response: {}", last_msg.content[:100])
+        logger.opt(lazy=True).debug("Bot response: {}", lambda: last_msg.content[:100])
         print(f"Bot: {last_msg.content}")
         print()
 
@@ -134,9 +140,7 @@ def main() -> None:
 
                 # Flush Langfuse if enabled
                 if langfuse_handler:
-                    from langfuse import get_client
-
-                    get_client().flush()
+                    _get_langfuse_client().flush()
 
                 return
             # Stop scanning once we hit an AIMessage (only check recent batch)
@@ -145,9 +149,7 @@ def main() -> None:
 
     # Flush Langfuse on exit
     if langfuse_handler:
-        from langfuse import get_client
-
-        get_client().flush()
+        _get_langfuse_client().flush()
 
     logger.info("Chatbot session ended (session_id={})", session_id)
 
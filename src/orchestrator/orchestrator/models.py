@@ -1,14 +1,18 @@
-import json
+from functools import cached_property
 from pathlib import Path
 from typing import Self
 import uuid
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from .enums import Size, CategoryName
 
 
 class Modifier(BaseModel):
+    # Frozen: modifiers are hashed (Item.__hash__, set comparisons) and shared
+    # between menu items and order items, so they must never change in place.
+    model_config = ConfigDict(frozen=True)
+
     modifier_id: str
     name: str
 
@@ -22,6 +26,8 @@ class Modifier(BaseModel):
 
 
 class Location(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     address: str
@@ -38,6 +44,11 @@ class Location(BaseModel):
     def __hash__(self) -> int:
         return hash(self.id)
 
+    @cached_property
+    def full_address(self) -> str:
+        """Single-line street address (built once; Location is frozen)."""
+        return f"{self.address}, {self.city}, {self.state} {self.zip}"
+
 
 class Item(BaseModel):
     item_id: str
@@ -64,7 +75,7 @@ class Item(BaseModel):
             self.item_id == other.item_id
             and self.name == other.name
             and self.category_name == other.category_name
-            and set(self.modifiers) == set(other.modifiers)
+            and self._same_modifiers(other)
         )
 
     def __hash__(self) -> int:
@@ -72,13 +83,23 @@ class Item(BaseModel):
             (self.item_id, self.name, self.category_name, frozenset(self.modifiers))
         )
 
+    def _same_modifiers(self, other: "Item") -> bool:
+        """Order-independent modifier comparison.
+
+        The list check settles the common cases (no modifiers, or the same
+        modifiers in the same order) without building sets.
+        """
+        if self.modifiers == other.modifiers:
+            return True
+        return set(self.modifiers) == set(other.modifiers)
+
     def _is_same_item(self, other: "Item") -> bool:
         """Check if this is the same item configuration (for ordering/addition)."""
         return (
             self.item_id == other.item_id
             and self.name == other.name
             and self.category_name == other.category_name
-            and set(self.modifiers) == set(other.modifiers)
+            and self._same_modifiers(other)
         )
 
     def __ge__(self, other: object) -> bool:
@@ -104,16 +125,10 @@ class Item(BaseModel):
     def __add__(self, other: object) -> "Item":
         if not isinstance(other, Item) or not self._is_same_item(other):
             return NotImplemented
-        return Item(
-            item_id=self.item_id,
-            name=self.name,
-            category_name=self.category_name,
-            default_size=self.default_size,
-            size=self.size,
-            quantity=self.quantity + other.quantity,
-            modifiers=list(self.modifiers),
-            available_modifiers=list(self.available_modifiers),
-        )
+        # Shallow copy without revalidation: both operands are already valid
+        # and the summed quantity stays >= 1. The modifier lists are shared,
+        # which is safe because order items are replaced, never mutated.
+        return self.model_copy(update={"quantity": self.quantity + other.quantity})
 
 
 class Order(BaseModel):
@@ -140,11 +155,15 @@ class Order(BaseModel):
 
 
 class Menu(BaseModel):
+    # Frozen: one Menu instance is loaded per process and shared by reference
+    # across graph invocations, so it must never be mutated in place.
+    model_config = ConfigDict(frozen=True)
+
     menu_id: str
     menu_name: str
     menu_version: str
     location: Location
-    items: list[Item]
+    items: tuple[Item, ...]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Menu):
@@ -158,6 +177,19 @@ class Menu(BaseModel):
     def __hash__(self) -> int:
         return hash((self.menu_id, self.menu_name, self.menu_version))
 
+    @cached_property
+    def item_by_id(self) -> dict[str, Item]:
+        """Menu items keyed by item_id (built once, on first access)."""
+        return {item.item_id: item for item in self.items}
+
+    @cached_property
+    def item_by_name(self) -> dict[str, Item]:
+        """Menu items keyed by lowercased name (first item wins on duplicates)."""
+        index: dict[str, Item] = {}
+        for item in self.items:
+            index.setdefault(item.name.lower(), item)
+        return index
+
     @classmethod
     def from_dict(cls, data: dict) -> "Menu":
         """Load Menu from a dictionary (matching JSON structure)."""
@@ -167,12 +199,36 @@ class Menu(BaseModel):
             menu_name=metadata["menu_name"],
             menu_version=metadata["menu_version"],
             location=Location(**metadata["location"]),
-            items=[Item(**item) for item in data["items"]],
+            items=tuple(Item(**item) for item in data["items"]),
         )
 
     @classmethod
     def from_json_file(cls, path: str | Path) -> "Menu":
-        """Load Menu from a JSON file path."""
-        with open(path, "r") as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        """Load Menu from a JSON file path.
+
+        pydantic-core parses and validates the file in one pass via
+        _MenuFile, which mirrors the on-disk {"metadata", "items"} layout.
+        """
+        menu_file = _MenuFile.model_validate_json(Path(path).read_bytes())
+        metadata = menu_file.metadata
+        return cls(
+            menu_id=metadata.menu_id,
+            menu_name=metadata.menu_name,
+            menu_version=metadata.menu_version,
+            location=metadata.location,
+            items=menu_file.items,
+        )
+
+
+class _MenuMetadata(BaseModel):
+    menu_id: str
+    menu_name: str
+    menu_version: str
+    location: Location
+
+
+class _MenuFile(BaseModel):
+    """On-disk menu JSON layout, used by Menu.from_json_file."""
+
+    metadata: _MenuMetadata
+    items: tuple[Item, ...]
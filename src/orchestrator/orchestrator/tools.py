@@ -31,28 +31,29 @@ def lookup_menu_item(
     """
     logger.info("Looking up menu item: {}", item_name)
 
-    # Exact match (case-insensitive)
-    for item in menu.items:
-        if item.name.lower() == item_name.lower():
-            logger.info("Found exact match: {} ({})", item.name, item.item_id)
-            return {
-                "found": True,
-                "item_id": item.item_id,
-                "name": item.name,
-                "category_name": item.category_name.value,
-                "default_size": item.default_size.value,
-                "available_modifiers": [
-                    {"modifier_id": m.modifier_id, "name": m.name}
-                    for m in item.available_modifiers
-                ],
-            }
+    query = item_name.lower()
+
+    # Exact match (case-insensitive) via the menu's name index
+    item = menu.item_by_name.get(query)
+    if item is not None:
+        logger.info("Found exact match: {} ({})", item.name, item.item_id)
+        return {
+            "found": True,
+            "item_id": item.item_id,
+            "name": item.name,
+            "category_name": item.category_name.value,
+            "default_size": item.default_size.value,
+            "available_modifiers": [
+                {"modifier_id": m.modifier_id, "name": m.name}
+                for m in item.available_modifiers
+            ],
+        }
 
     # No exact match — suggest similar items (substring match)
     suggestions = [
         item.name
         for item in menu.items
-        if item_name.lower() in item.name.lower()
-        or item.name.lower() in item_name.lower()
+        if query in item.name.lower() or item.name.lower() in query
     ]
 
     logger.warning(
@@ -101,7 +102,7 @@ def add_item_to_order(
     )
 
     # Validate item exists on menu
-    menu_item = next((i for i in menu.items if i.item_id == item_id), None)
+    menu_item = menu.item_by_id.get(item_id)
     if not menu_item:
         logger.warning("Item not found on menu: {}", item_id)
         return {"added": False, "error": f"Item '{item_id}' not found on menu."}
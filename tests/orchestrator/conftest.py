@@ -17,9 +17,9 @@ MENU_JSON_PATH = (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def menu() -> Menu:
-    """Load the breakfast menu from JSON."""
+    """Load the breakfast menu from JSON (once; Menu is frozen)."""
     return Menu.from_json_file(MENU_JSON_PATH)
 
 
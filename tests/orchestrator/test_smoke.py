@@ -9,7 +9,7 @@ import json
 from langchain_core.messages import AIMessage, ToolMessage
 
 from orchestrator.graph import DriveThruState, _extract_reasoning, graph, update_order
-from orchestrator.models import Menu, Order
+from orchestrator.models import Item, Menu, Order
 from orchestrator.enums import CategoryName, Size
 
 
@@ -51,6 +51,18 @@ class TestMenuLoads:
             assert isinstance(item.category_name, CategoryName)
             assert isinstance(item.default_size, Size)
 
+    def test_menu_item_by_id_indexes_all_items(self, menu: Menu):
+        """item_by_id should map every item_id to its menu item."""
+        assert len(menu.item_by_id) == len(menu.items)
+        for item in menu.items:
+            assert menu.item_by_id[item.item_id] is item
+
+    def test_menu_item_by_name_is_case_insensitive(self, menu: Menu):
+        """item_by_name should resolve lowercased names to the first such item."""
+        for item in menu.items:
+            found = menu.item_by_name[item.name.lower()]
+            assert found.name == item.name
+
 
 class TestUpdateOrderNode:
     """Test the update_order node processes tool results correctly."""
@@ -161,6 +173,43 @@ class TestUpdateOrderNode:
         assert len(result["current_order"].items) == 0
 
 
+class TestOrderAdd:
+    """Test merging duplicate items into an Order."""
+
+    def test_adding_same_item_twice_merges_quantities(
+        self, menu: Menu, empty_order: Order
+    ):
+        """Item.__add__ should return a new Item and leave both operands as-is."""
+        menu_item = next(i for i in menu.items if i.available_modifiers)
+        modifiers = list(menu_item.available_modifiers)
+        first = Item(
+            item_id=menu_item.item_id,
+            name=menu_item.name,
+            category_name=menu_item.category_name,
+            quantity=1,
+            modifiers=modifiers,
+        )
+        second = Item(
+            item_id=menu_item.item_id,
+            name=menu_item.name,
+            category_name=menu_item.category_name,
+            quantity=2,
+            modifiers=list(reversed(modifiers)),
+        )
+
+        order = empty_order + first + second
+
+        assert len(order.items) == 1
+        merged = order.items[0]
+        assert merged.quantity == 3
+        assert merged is not first and merged is not second
+        assert set(merged.modifiers) == set(modifiers)
+        assert first.quantity == 1
+        assert second.quantity == 2
+        assert first.modifiers == modifiers
+        assert second.modifiers == list(reversed(modifiers))
+
+
 class TestReasoning:
     """Test reasoning extraction and formatting."""
 